@@ -1,4 +1,3 @@
-import os
 from pynwb import load_namespaces, get_class
 
 try:
@@ -12,7 +11,7 @@ __location_of_this_file = files(__name__)
 __spec_path = __location_of_this_file / "spec" / "ndx-patterned-ogen.namespace.yaml"
 
 # If that path does not exist, we are likely running in editable mode. Use the local path instead
-if not os.path.exists(__spec_path):
+if not __spec_path.is_file():
     __spec_path = __location_of_this_file.parent.parent.parent / "spec" / "ndx-patterned-ogen.namespace.yaml"
     
 load_namespaces(str(__spec_path))
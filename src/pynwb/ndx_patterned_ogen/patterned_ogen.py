@@ -1,5 +1,5 @@
 from collections.abc import Iterable
-from hdmf.utils import docval, popargs_to_dict, get_docval, popargs
+from hdmf.utils import docval, get_docval, popargs
 from pynwb import register_class
 from pynwb.core import DynamicTableRegion
 from pynwb.device import Device
@@ -9,6 +9,12 @@ import numpy as np
 
 namespace = "ndx-patterned-ogen"
 
+# types accepted for the stimulation parameters in PatternedOptogeneticStimulusTable
+_SCALAR_TYPES = (int, float, np.generic)
+_SCALAR_OR_ARRAY_TYPES = (int, float, Iterable)
+# stimulation parameters that can be given either as a scalar or as an array with one value per roi ("*_per_roi")
+_STIMULATION_PARAMETERS = ("power", "frequency", "pulse_width")
+
 
 @register_class("PatternedOptogeneticStimulusSite", namespace)
 class PatternedOptogeneticStimulusSite(OptogeneticStimulusSite):
@@ -35,11 +41,13 @@ class PatternedOptogeneticStimulusSite(OptogeneticStimulusSite):
         {"name": "light_source", "type": Device, "doc": "Light source used to apply photostimulation."},
     )
     def __init__(self, **kwargs):
-        keys_to_set = ("effector", "spatial_light_modulator", "light_source")
-        args_to_set = popargs_to_dict(keys_to_set, kwargs)
+        effector, spatial_light_modulator, light_source = popargs(
+            "effector", "spatial_light_modulator", "light_source", kwargs
+        )
         super().__init__(**kwargs)
-        for key, val in args_to_set.items():
-            setattr(self, key, val)
+        self.effector = effector
+        self.spatial_light_modulator = spatial_light_modulator
+        self.light_source = light_source
 
     @docval({
         "name": "spatial_light_modulator",
@@ -96,11 +104,10 @@ class OptogeneticStimulusTarget(LabMetaData):
         },
     )
     def __init__(self, **kwargs):
-        keys_to_set = ("segmented_rois", "targeted_rois")
-        args_to_set = popargs_to_dict(keys_to_set, kwargs)
+        segmented_rois, targeted_rois = popargs("segmented_rois", "targeted_rois", kwargs)
         super().__init__(**kwargs)
-        for key, val in args_to_set.items():
-            setattr(self, key, val)
+        self.segmented_rois = segmented_rois
+        self.targeted_rois = targeted_rois
 
 
 @register_class("PatternedOptogeneticStimulusTable", namespace)
@@ -166,23 +173,30 @@ class PatternedOptogeneticStimulusTable(TimeIntervals):
 
     @classmethod
     def check_if_argument_is_not_scalar(cls, colset, field_name):
-        for row in range(len(colset[field_name])):
-            if not isinstance(colset[field_name][row], (int, float, np.generic)):
-                raise ValueError(
-                    f"{field_name} should be defined as scalar. Use '{field_name}_per_roi' to store photostimulation"
-                    f" at different {field_name}, for each rois in target."
-                )
+        # the whole column is read once: it holds only scalars if it converts to a 1D numeric array
+        try:
+            values = np.asarray(colset[field_name][:])
+        except ValueError:  # a mix of scalars and arrays
+            values = None
+        if values is None or values.ndim != 1 or values.dtype.kind not in "biufc":
+            raise ValueError(
+                f"{field_name} should be defined as scalar. Use '{field_name}_per_roi' to store photostimulation"
+                f" at different {field_name}, for each rois in target."
+            )
 
     @classmethod
     def check_length_rois_properties(cls, colset, field_name):
-        for row in range(len(colset[field_name])):
-            n_targets = len(colset["targets"][row].targeted_rois[:])
-            n_elements = len(colset[field_name][row])
-            if n_elements != n_targets:
-                raise ValueError(
-                    f"'{field_name}' has {n_elements} elements but it must have {n_targets} elements to match the"
-                    " length of 'targeted_rois'."
-                )
+        values = colset[field_name][:]
+        targets = colset["targets"][:]
+        n_elements = np.fromiter(map(len, values), dtype=int, count=len(values))
+        n_targets = np.fromiter((len(target.targeted_rois) for target in targets), dtype=int, count=len(targets))
+        mismatched_rows = np.flatnonzero(n_elements != n_targets)
+        if mismatched_rows.size > 0:
+            row = mismatched_rows[0]
+            raise ValueError(
+                f"'{field_name}' has {n_elements[row]} elements but it must have {n_targets[row]} elements to match"
+                " the length of 'targeted_rois'."
+            )
 
     @docval(
         {
@@ -200,32 +214,33 @@ class PatternedOptogeneticStimulusTable(TimeIntervals):
         *get_docval(TimeIntervals.__init__, "id", "columns", "colnames"),
     )
     def __init__(self, **kwargs):
-        keys_to_set = ()
-        args_to_set = popargs_to_dict(keys_to_set, kwargs)
-
         super().__init__(**kwargs)
-        for key, val in args_to_set.items():
-            setattr(self, key, val)
         columns = popargs("columns", kwargs)
         if columns is not None:
-            colset = {c.name: c for c in columns}
-            # First check: power_per_roi and power must not be defined in the same time
-            for colname in colset.keys():
-                if colname in colset.keys() and f"{colname}_per_roi" in colset.keys():
-                    raise ValueError(
-                        f"Both '{colname}' and '{colname}_per_roi' have been defined. Only one of them must be defined."
-                    )
+            self.check_columns(colset={c.name: c for c in columns})
 
-            # Second check: all elements in "power", "frequency", "pulse_width" must be scalars
-            for column_to_check in ["power", "frequency", "pulse_width"]:
-                if column_to_check in colset.keys():
-                    self.check_if_argument_is_not_scalar(colset=colset, field_name=column_to_check)
+    @classmethod
+    def check_columns(cls, colset):
+        """
+        Check that the stimulation parameters in colset, a mapping from column name to per-row values, are consistent.
+        """
+        # First check: power_per_roi and power must not be defined in the same time
+        for colname in colset.keys():
+            if colname in colset.keys() and f"{colname}_per_roi" in colset.keys():
+                raise ValueError(
+                    f"Both '{colname}' and '{colname}_per_roi' have been defined. Only one of them must be defined."
+                )
+
+        # Second check: all elements in "power", "frequency", "pulse_width" must be scalars
+        for column_to_check in _STIMULATION_PARAMETERS:
+            if column_to_check in colset.keys():
+                cls.check_if_argument_is_not_scalar(colset=colset, field_name=column_to_check)
 
-            # Third check: all elements in "power_per_roi", "frequency_per_roi", "pulse_width_per_roi" columns
-            # must be the same length as the respective targets
-            for column_to_check in ["power_per_roi", "frequency_per_roi", "pulse_width_per_roi"]:
-                if column_to_check in colset.keys():
-                    self.check_length_rois_properties(colset=colset, field_name=column_to_check)
+        # Third check: all elements in "power_per_roi", "frequency_per_roi", "pulse_width_per_roi" columns
+        # must be the same length as the respective targets
+        for column_to_check in _STIMULATION_PARAMETERS:
+            if f"{column_to_check}_per_roi" in colset.keys():
+                cls.check_length_rois_properties(colset=colset, field_name=f"{column_to_check}_per_roi")
 
     @docval(
         {"name": "start_time", "doc": "Start time of stimulation, in seconds.", "type": float},
@@ -233,7 +248,7 @@ class PatternedOptogeneticStimulusTable(TimeIntervals):
         {
             "name": "power",
             "doc": "Power (in Watts) defined as a scalar. All rois in target receive the same photostimulation power.",
-            "type": (int, float, Iterable),
+            "type": _SCALAR_OR_ARRAY_TYPES,
             "default": None,
         },
         {
@@ -242,7 +257,7 @@ class PatternedOptogeneticStimulusTable(TimeIntervals):
                 "Frequency (in Hz) defined as a scalar. All rois in target receive the photostimulation at the same"
                 " frequency."
             ),
-            "type": (int, float, Iterable),
+            "type": _SCALAR_OR_ARRAY_TYPES,
             "default": None,
         },
         {
@@ -251,19 +266,19 @@ class PatternedOptogeneticStimulusTable(TimeIntervals):
                 "Pulse Width (in sec/phase) defined as a scalar. All rois in target receive the photostimulation with"
                 " the same pulse width."
             ),
-            "type": (int, float, Iterable),
+            "type": _SCALAR_OR_ARRAY_TYPES,
             "default": None,
         },
         {
             "name": "power_per_roi",
             "doc": "Power (in Watts) defined as an array. Each power value refers to each roi in target.",
-            "type": (int, float, Iterable),
+            "type": _SCALAR_OR_ARRAY_TYPES,
             "default": None,
         },
         {
             "name": "frequency_per_roi",
             "doc": "Frequency (in Hz) defined as an array. Each frequency value refers to each roi in target.",
-            "type": (int, float, Iterable),
+            "type": _SCALAR_OR_ARRAY_TYPES,
             "default": None,
         },
         {
@@ -271,7 +286,7 @@ class PatternedOptogeneticStimulusTable(TimeIntervals):
             "doc": (
                 "Pulse Width (in sec/phase) defined as an array. Each pulse width value refers to each roi in target."
             ),
-            "type": (int, float, Iterable),
+            "type": _SCALAR_OR_ARRAY_TYPES,
             "default": None,
         },
         {
@@ -295,55 +310,172 @@ class PatternedOptogeneticStimulusTable(TimeIntervals):
         """
         Add a stimulation parameters for a specific stimulus onset.
         """
-        super(PatternedOptogeneticStimulusTable, self).add_interval(**kwargs)
+        for parameter in _STIMULATION_PARAMETERS:
+            value = kwargs[parameter]
+            if value is not None and not isinstance(value, _SCALAR_TYPES):
+                raise ValueError(
+                    f"'{parameter}' should be defined as scalar. Use '{parameter}_per_roi' to store photostimulation"
+                    f" at different {parameter}, for each rois in target."
+                )
 
-        if kwargs["power"] is not None and not isinstance(kwargs["power"], (int, float, np.generic)):
-            raise ValueError(
-                "'power' should be defined as scalar. Use 'power_per_roi' to store photostimulation at different"
-                " power, for each rois in target."
-            )
-        if kwargs["frequency"] is not None and not isinstance(kwargs["frequency"], (int, float, np.generic)):
-            raise ValueError(
-                "'frequency' should be defined as scalar. Use 'frequency_per_roi' to store photostimulation at"
-                " different frequency, for each rois in target."
-            )
+        # the number of targeted rois is only needed when a parameter is defined per roi
+        n_targets = None
+        for parameter in _STIMULATION_PARAMETERS:
+            per_roi = kwargs[f"{parameter}_per_roi"]
+            if per_roi is None:
+                continue
+            if n_targets is None:
+                n_targets = len(kwargs["targets"].targeted_rois)
+            if len(per_roi) != n_targets:
+                raise ValueError(
+                    f"'{parameter}_per_roi' has {len(per_roi)} elements but it must have {n_targets} elements to match"
+                    " the length of 'targeted_rois'."
+                )
 
-        if kwargs["pulse_width"] is not None and not isinstance(kwargs["pulse_width"], (int, float, np.generic)):
+        power, power_per_roi = kwargs["power"], kwargs["power_per_roi"]
+        if power_per_roi is None and power is None:
             raise ValueError(
-                "'pulse_width' should be defined as scalar. Use 'pulse_width_per_roi' to store photostimulation with"
-                " different pulse width, for each rois in target."
+                "Neither 'power' nor 'power_per_roi' have been defined. At least one of the two must be defined."
             )
 
-        n_targets = len(kwargs["targets"].targeted_rois[:])
+        if power_per_roi is not None and power is not None:
+            raise ValueError("Both 'power' and 'power_per_roi' have been defined. Only one of them must be defined.")
 
-        if kwargs["power_per_roi"] is not None:
-            n_elements = len(kwargs["power_per_roi"])
-            if n_elements != n_targets:
-                raise ValueError(
-                    f"'power_per_roi' has {n_elements} elements but it must have"
-                    f" {n_targets} elements to match the length of 'targeted_rois'."
-                )
+        # the row is only added once all the checks passed, so that a failing call leaves the table unchanged
+        super(PatternedOptogeneticStimulusTable, self).add_interval(**kwargs)
 
-        if kwargs["frequency_per_roi"] is not None:
-            n_elements = len(kwargs["frequency_per_roi"])
-            if n_elements != n_targets:
-                raise ValueError(
-                    f"'frequency_per_roi' has {n_elements} elements but it must have"
-                    f" {n_targets} elements as 'targeted_roi'."
-                )
+    @docval(
+        {
+            "name": "start_time",
+            "doc": "Start times of stimulation, in seconds.",
+            "type": "array_data",
+            "shape": (None,),
+        },
+        {
+            "name": "stop_time",
+            "doc": "Stop times of stimulation, in seconds.",
+            "type": "array_data",
+            "shape": (None,),
+        },
+        {
+            "name": "power",
+            "doc": (
+                "Power (in Watts) of each stimulus onset, or a single power used for all of them. All rois in target"
+                " receive the same photostimulation power."
+            ),
+            "type": ("array_data", int, float),
+            "default": None,
+        },
+        {
+            "name": "frequency",
+            "doc": (
+                "Frequency (in Hz) of each stimulus onset, or a single frequency used for all of them. All rois in"
+                " target receive the photostimulation at the same frequency."
+            ),
+            "type": ("array_data", int, float),
+            "default": None,
+        },
+        {
+            "name": "pulse_width",
+            "doc": (
+                "Pulse Width (in sec/phase) of each stimulus onset, or a single pulse width used for all of them. All"
+                " rois in target receive the photostimulation with the same pulse width."
+            ),
+            "type": ("array_data", int, float),
+            "default": None,
+        },
+        {
+            "name": "power_per_roi",
+            "doc": "Power (in Watts) of each stimulus onset, defined as an array with one value per roi in target.",
+            "type": "array_data",
+            "default": None,
+        },
+        {
+            "name": "frequency_per_roi",
+            "doc": "Frequency (in Hz) of each stimulus onset, defined as an array with one value per roi in target.",
+            "type": "array_data",
+            "default": None,
+        },
+        {
+            "name": "pulse_width_per_roi",
+            "doc": (
+                "Pulse Width (in sec/phase) of each stimulus onset, defined as an array with one value per roi in"
+                " target."
+            ),
+            "type": "array_data",
+            "default": None,
+        },
+        {
+            "name": "targets",
+            "doc": "Targeted rois for each stimulus onset, or a single target used for all of them.",
+            "type": (OptogeneticStimulusTarget, list, tuple),
+        },
+        {
+            "name": "stimulus_pattern",
+            "doc": "Link to the stimulus pattern of each stimulus onset, or a single pattern used for all of them.",
+            "type": (LabMetaData, list, tuple),
+        },
+        {
+            "name": "stimulus_site",
+            "doc": "Link to the stimulus site of each stimulus onset, or a single site used for all of them.",
+            "type": (PatternedOptogeneticStimulusSite, list, tuple),
+        },
+    )
+    def add_intervals(self, **kwargs):
+        """
+        Add stimulation parameters for several stimulus onsets at once.
+
+        The parameters are validated once and each column is extended in a single call, which is much faster than
+        calling add_interval for every stimulus onset.
+        """
+        n_intervals = len(kwargs["start_time"])
+        # a single value is used for all the stimulus onsets
+        for key in _STIMULATION_PARAMETERS:
+            if isinstance(kwargs[key], _SCALAR_TYPES):
+                kwargs[key] = [kwargs[key]] * n_intervals
+        for key, element_type in (
+            ("targets", OptogeneticStimulusTarget),
+            ("stimulus_pattern", LabMetaData),
+            ("stimulus_site", PatternedOptogeneticStimulusSite),
+        ):
+            if not isinstance(kwargs[key], (list, tuple)):
+                kwargs[key] = [kwargs[key]] * n_intervals
+            # docval only checks the type of the sequence, so each element is checked here
+            for element in kwargs[key]:
+                if not isinstance(element, element_type):
+                    raise TypeError(
+                        f"incorrect type for an element of '{key}' (got '{type(element).__name__}', expected"
+                        f" '{element_type.__name__}')"
+                    )
 
-        if kwargs["pulse_width_per_roi"] is not None:
-            n_elements = len(kwargs["pulse_width_per_roi"])
-            if n_elements != n_targets:
+        colset = {key: val for key, val in kwargs.items() if val is not None}
+        for key, val in colset.items():
+            if len(val) != n_intervals:
                 raise ValueError(
-                    f"'pulse_width_per_roi' has {n_elements} elements but it must have"
-                    f" {n_targets} elements as 'targeted_roi'."
+                    f"'{key}' has {len(val)} elements but it must have {n_intervals} elements to match the length of"
+                    " 'start_time'."
                 )
-
-        if kwargs["power_per_roi"] is None and kwargs["power"] is None:
+        if "power" not in colset and "power_per_roi" not in colset:
             raise ValueError(
                 "Neither 'power' nor 'power_per_roi' have been defined. At least one of the two must be defined."
             )
+        self.check_columns(colset=colset)
+        # columns holding a single number per stimulus onset are converted once to float arrays
+        for key in ("start_time", "stop_time", *_STIMULATION_PARAMETERS):
+            if key in colset:
+                colset[key] = np.asarray(colset[key], dtype=float)
 
-        if kwargs["power_per_roi"] is not None and kwargs["power"] is not None:
-            raise ValueError("Both 'power' and 'power_per_roi' have been defined. Only one of them must be defined.")
+        missing_columns = set(self.colnames) - set(colset)
+        if missing_columns:
+            raise ValueError(f"Values for the columns {sorted(missing_columns)} are missing.")
+        # the table is only modified once all the checks passed, so that a failing call leaves it unchanged
+        if n_intervals == 0:
+            return
+
+        # optional columns are created on first use, as in DynamicTable.add_row
+        for col in self.__columns__:
+            if col["name"] in colset and col["name"] not in self.colnames:
+                self.add_column(name=col["name"], description=col["description"])
+        self.id.extend(list(range(len(self), len(self) + n_intervals)))
+        for key, val in colset.items():
+            self[key].extend(val)
@@ -22,14 +22,22 @@ from ndx_patterned_ogen import (
     LightSource,
 )
 
+# zero-valued masks shared by all the mock patterns, as read-only broadcast views of a single zero
+_ZERO_MASK_2D = np.broadcast_to(0.0, (10, 10))
+_ZERO_MASK_3D = np.broadcast_to(0.0, (10, 10, 2))
+
 
 def mock_OptogeneticStimulus2DPattern(
     name: Optional[str] = None,
     description: str = "Generic description for optogenetic stimulus 2D pattern",
-    sweep_size_in_um: list = [5],  # um
-    sweep_mask=np.zeros((10, 10)),
+    sweep_size_in_um: Optional[list] = None,  # um
+    sweep_mask: Optional[np.ndarray] = None,
     nwbfile: Optional[NWBFile] = None,
 ) -> OptogeneticStimulus2DPattern:
+    if sweep_size_in_um is None:
+        sweep_size_in_um = [5]
+    if sweep_mask is None:
+        sweep_mask = _ZERO_MASK_2D
     stimulus_pattern = OptogeneticStimulus2DPattern(
         name=name or name_generator("OptogeneticStimulus2DPattern"),
         description=description,
@@ -43,10 +51,14 @@ def mock_OptogeneticStimulus2DPattern(
 def mock_OptogeneticStimulus3DPattern(
     name: Optional[str] = None,
     description: str = "Generic description for optogenetic stimulus 3D pattern",
-    sweep_size_in_um: list = [5],  # um
-    sweep_mask=np.zeros((10, 10, 2)),
+    sweep_size_in_um: Optional[list] = None,  # um
+    sweep_mask: Optional[np.ndarray] = None,
     nwbfile: Optional[NWBFile] = None,
 ) -> OptogeneticStimulus3DPattern:
+    if sweep_size_in_um is None:
+        sweep_size_in_um = [5]
+    if sweep_mask is None:
+        sweep_mask = _ZERO_MASK_3D
     stimulus_pattern = OptogeneticStimulus3DPattern(
         name=name or name_generator("OptogeneticStimulus3DPattern"),
         description=description,
@@ -129,9 +141,11 @@ def mock_SpatialLightModulator2D(
     description: str = "Generic description for the spatial light modulator device",
     model: str = "Generic model for the spatial light modulator device",
     manufacturer: Optional[str] = None,
-    spatial_resolution_in_px: list = [100, 100],
+    spatial_resolution_in_px: Optional[list] = None,
     nwbfile: Optional[NWBFile] = None,
 ) -> SpatialLightModulator2D:
+    if spatial_resolution_in_px is None:
+        spatial_resolution_in_px = [100, 100]
     spatial_light_modulator = SpatialLightModulator2D(
         name=name or name_generator("SpatialLightModulator2D"),  # nm
         description=description,
@@ -148,9 +162,11 @@ def mock_SpatialLightModulator3D(
     description: str = "Generic description for the spatial light modulator device",
     model: str = "Generic model for the spatial light modulator device",
     manufacturer: Optional[str] = None,
-    spatial_resolution_in_px: list = [100, 100, 100],
+    spatial_resolution_in_px: Optional[list] = None,
     nwbfile: Optional[NWBFile] = None,
 ) -> SpatialLightModulator3D:
+    if spatial_resolution_in_px is None:
+        spatial_resolution_in_px = [100, 100, 100]
     spatial_light_modulator = SpatialLightModulator3D(
         name=name or name_generator("SpatialLightModulator3D"),  # nm
         description=description,
@@ -173,12 +189,18 @@ def mock_PatternedOptogeneticStimulusSite(
     effector: str = "ChR2",
     nwbfile: Optional[NWBFile] = None,
 ) -> PatternedOptogeneticStimulusSite:
+    if device is None:
+        device = mock_Device(nwbfile=nwbfile)
+    if light_source is None:
+        light_source = mock_LightSource(nwbfile=nwbfile)
+    if spatial_light_modulator is None:
+        spatial_light_modulator = mock_SpatialLightModulator2D(nwbfile=nwbfile)
     optogenetic_stimulus_site = PatternedOptogeneticStimulusSite(
         name=name or name_generator("PatternedOptogeneticStimulusSite"),
         description=description,
-        device=device or mock_Device(nwbfile=nwbfile),
-        light_source=light_source or mock_LightSource(nwbfile=nwbfile),
-        spatial_light_modulator=spatial_light_modulator or mock_SpatialLightModulator2D(nwbfile=nwbfile),
+        device=device,
+        light_source=light_source,
+        spatial_light_modulator=spatial_light_modulator,
         excitation_lambda=excitation_lambda,
         location=location,
         effector=effector,
@@ -198,23 +220,33 @@ def mock_OptogeneticStimulusTarget(
     plane_segmentation: Optional[PlaneSegmentation] = None,
     nwbfile: Optional[NWBFile] = None,
 ) -> OptogeneticStimulusTarget:
-    hologram = OptogeneticStimulusTarget(
-        name=name or name_generator("Hologram"),
-        targeted_rois=targeted_rois
-        or DynamicTableRegion(
+    # tables and regions define __len__, so an empty one would be falsy: compare with None explicitly
+    if targeted_rois is None:
+        targeted_rois = DynamicTableRegion(
             name="targeted_rois",
             description="targeted rois",
-            table=plane_segmentation
-            or mock_PlaneSegmentation(n_rois=n_rois, name="TargetPlaneSegmentation", nwbfile=nwbfile),
-            data=list(range(n_rois)),
-        ),
-        segmented_rois=segmented_rois
-        or DynamicTableRegion(
+            table=(
+                mock_PlaneSegmentation(n_rois=n_rois, name="TargetPlaneSegmentation", nwbfile=nwbfile)
+                if plane_segmentation is None
+                else plane_segmentation
+            ),
+            data=np.arange(n_rois),
+        )
+    if segmented_rois is None:
+        segmented_rois = DynamicTableRegion(
             name="segmented_rois",
             description="segmented rois after photostimulation",
-            table=plane_segmentation or mock_PlaneSegmentation(n_rois=n_rois, nwbfile=nwbfile),
-            data=list(range(n_rois)),
-        ),
+            table=(
+                mock_PlaneSegmentation(n_rois=n_rois, nwbfile=nwbfile)
+                if plane_segmentation is None
+                else plane_segmentation
+            ),
+            data=np.arange(n_rois),
+        )
+    hologram = OptogeneticStimulusTarget(
+        name=name or name_generator("Hologram"),
+        targeted_rois=targeted_rois,
+        segmented_rois=segmented_rois,
     )
     nwbfile.add_lab_meta_data(hologram)
     return hologram
@@ -223,30 +255,56 @@ def mock_OptogeneticStimulusTarget(
 def mock_PatternedOptogeneticStimulusTable(
     name: Optional[str] = None,
     description: str = "no description",
-    start_time: list = [0.0, 0.1, 0.2],
-    stop_time: list = [0.7, 0.8, 0.9],
-    power: list = [0.7, 0.8, 0.9],
-    frequency: list = [20.0, 10.0, 5.0],
-    pulse_width: list = [0.01, 0.02, 0.05],
-    stimulus_pattern: list = [None, None, None],
-    targets: list = [None, None, None],
-    stimulus_site: list = [None, None, None],
+    start_time: Optional[list] = None,
+    stop_time: Optional[list] = None,
+    power: Optional[list] = None,
+    frequency: Optional[list] = None,
+    pulse_width: Optional[list] = None,
+    stimulus_pattern: Optional[list] = None,
+    targets: Optional[list] = None,
+    stimulus_site: Optional[list] = None,
     nwbfile: Optional[NWBFile] = None,
 ) -> PatternedOptogeneticStimulusTable:
+    if start_time is None:
+        start_time = [0.0, 0.1, 0.2]
+    if stop_time is None:
+        stop_time = [0.7, 0.8, 0.9]
+    if power is None:
+        power = [0.7, 0.8, 0.9]
+    if frequency is None:
+        frequency = [20.0, 10.0, 5.0]
+    if pulse_width is None:
+        pulse_width = [0.01, 0.02, 0.05]
+    if stimulus_pattern is None:
+        stimulus_pattern = [None] * len(start_time)
+    if targets is None:
+        targets = [None] * len(start_time)
+    if stimulus_site is None:
+        stimulus_site = [None] * len(start_time)
     optogenetic_stimulus_table = PatternedOptogeneticStimulusTable(
         name=name or name_generator("PatternedOptogeneticStimulusTable"), description="Patterned stimulus"
     )
-    for i, start in enumerate(start_time):
-        optogenetic_stimulus_table.add_interval(
-            start_time=start,
-            stop_time=stop_time[i],
-            power=power[i],
-            frequency=frequency[i],
-            pulse_width=pulse_width[i],
-            stimulus_pattern=stimulus_pattern[i] or mock_OptogeneticStimulus2DPattern(nwbfile=nwbfile),
-            targets=targets[i] or mock_OptogeneticStimulusTarget(nwbfile=nwbfile),
-            stimulus_site=stimulus_site[i] or mock_PatternedOptogeneticStimulusSite(nwbfile=nwbfile),
-        )
+    # rows without their own pattern, target or site share a single mock one
+    default_stimulus_pattern = None
+    if any(pattern is None for pattern in stimulus_pattern):
+        default_stimulus_pattern = mock_OptogeneticStimulus2DPattern(nwbfile=nwbfile)
+    default_targets = None
+    if any(target is None for target in targets):
+        default_targets = mock_OptogeneticStimulusTarget(nwbfile=nwbfile)
+    default_stimulus_site = None
+    if any(site is None for site in stimulus_site):
+        default_stimulus_site = mock_PatternedOptogeneticStimulusSite(nwbfile=nwbfile)
+
+    optogenetic_stimulus_table.add_intervals(
+        start_time=start_time,
+        stop_time=stop_time,
+        power=power,
+        frequency=frequency,
+        pulse_width=pulse_width,
+        stimulus_pattern=[default_stimulus_pattern if pattern is None else pattern for pattern in stimulus_pattern],
+        targets=[default_targets if target is None else target for target in targets],
+        stimulus_site=[default_stimulus_site if site is None else site for site in stimulus_site],
+    )
 
     if nwbfile is not None:
         nwbfile.add_time_intervals(optogenetic_stimulus_table)
@@ -13,9 +13,12 @@ from .mock.patternedogen import (
     mock_PatternedOptogeneticStimulusSite,
 )
 
+# seeded generator for the random stimulation parameters, so that every run uses the same values
+_RNG = np.random.default_rng(seed=0)
+
 
 def set_up_nwbfile(nwbfile: NWBFile = None):
-    """Create an NWBFile with a Device"""
+    """Create an NWBFile, or return the given one."""
     nwbfile = nwbfile or mock_NWBFile()
     return nwbfile
 
@@ -99,9 +102,10 @@ class TestPatternedOgenConstructor(TestCase):
         stop_time = VectorData(name="stop_time", description="stop time", data=[1.0, 1.0, 1.0])
 
         targets_s = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        n_targets = targets_s.targeted_rois.shape[0]
         targets = VectorData(name="targets", description="targets", data=[targets_s, targets_s, targets_s])
 
-        per_rois = np.ones((len(targets_s.targeted_rois[:])))
+        per_rois = np.ones(n_targets)
         power_per_roi = VectorData(
             name="power_per_roi", description="power_per_roi", data=[per_rois, per_rois, per_rois]
         )
@@ -136,9 +140,10 @@ class TestPatternedOgenConstructor(TestCase):
         stop_time = VectorData(name="stop_time", description="stop time", data=[1.0, 1.0, 1.0])
 
         targets_s = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        n_targets = targets_s.targeted_rois.shape[0]
         targets = VectorData(name="targets", description="targets", data=[targets_s, targets_s, targets_s])
 
-        per_rois = np.ones((len(targets_s.targeted_rois[:]) + 2))
+        per_rois = np.ones(n_targets + 2)
         power_per_roi = VectorData(
             name="power_per_roi", description="power_per_roi", data=[per_rois, per_rois, per_rois]
         )
@@ -165,7 +170,7 @@ class TestPatternedOgenConstructor(TestCase):
         # Assert that the error message matches the expected one
         expected_error_message = (
             f"'power_per_roi' has {len(per_rois)} elements but it must have"
-            f" {targets_s.targeted_rois.shape[0]} elements to match the length of 'targeted_rois'."
+            f" {n_targets} elements to match the length of 'targeted_rois'."
         )
         self.assertEqual(str(context.exception), expected_error_message)
 
@@ -177,9 +182,10 @@ class TestPatternedOgenConstructor(TestCase):
         stop_time = VectorData(name="stop_time", description="stop time", data=[1.0, 1.0, 1.0])
 
         targets_s = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        n_targets = targets_s.targeted_rois.shape[0]
         targets = VectorData(name="targets", description="targets", data=[targets_s, targets_s, targets_s])
 
-        per_rois = np.ones((len(targets_s.targeted_rois[:])))
+        per_rois = np.ones(n_targets)
         power_per_roi = VectorData(
             name="power_per_roi", description="power_per_roi", data=[per_rois, per_rois, per_rois]
         )
@@ -253,7 +259,8 @@ class TestPatternedOgenConstructor(TestCase):
         stop_time = 1.0
 
         targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
-        power = np.random.uniform(50e-3, 70e-3, targets.targeted_rois.shape[0])
+        n_targets = targets.targeted_rois.shape[0]
+        power = np.full(n_targets, 60e-3)
 
         interval_parameter = dict(
             start_time=start_time,
@@ -266,6 +273,7 @@ class TestPatternedOgenConstructor(TestCase):
 
         with self.assertRaises(ValueError):
             stimulus_table.add_interval(**interval_parameter)
+        self.assertEqual(len(stimulus_table), 0)
 
     def test_constructor_add_interval_power_per_roi(self):
         """Test that the constructor for PatternedOptogeneticStimulusTable sets values as expected,
@@ -280,9 +288,10 @@ class TestPatternedOgenConstructor(TestCase):
         stop_time = 1.0
 
         targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
-        power_per_roi = np.random.uniform(50e-3, 70e-3, targets.targeted_rois.shape[0])
-        frequency_per_roi = np.random.uniform(20.0, 100.0, targets.targeted_rois.shape[0])
-        pulse_width_per_roi = np.random.uniform(0.1, 0.2, targets.targeted_rois.shape[0])
+        n_targets = targets.targeted_rois.shape[0]
+        power_per_roi = _RNG.uniform(50e-3, 70e-3, n_targets)
+        frequency_per_roi = _RNG.uniform(20.0, 100.0, n_targets)
+        pulse_width_per_roi = _RNG.uniform(0.1, 0.2, n_targets)
 
         stimulus_table.add_interval(
             start_time=start_time,
@@ -315,9 +324,10 @@ class TestPatternedOgenConstructor(TestCase):
         stop_time = 1.0
 
         targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
-        power_per_roi = np.random.uniform(50e-3, 70e-3, targets.targeted_rois.shape[0] + 2)
-        frequency_per_roi = np.random.uniform(20.0, 100.0, targets.targeted_rois.shape[0])
-        pulse_width_per_roi = np.random.uniform(0.1, 0.2, targets.targeted_rois.shape[0])
+        n_targets = targets.targeted_rois.shape[0]
+        power_per_roi = np.full(n_targets + 2, 60e-3)
+        frequency_per_roi = np.full(n_targets, 50.0)
+        pulse_width_per_roi = np.full(n_targets, 0.15)
 
         interval_parameter = dict(
             start_time=start_time,
@@ -335,10 +345,11 @@ class TestPatternedOgenConstructor(TestCase):
 
         # Assert that the error message matches the expected one
         expected_error_message = (
-            f"'power_per_roi' has {targets.targeted_rois.shape[0]+2} elements but it must have"
-            f" {targets.targeted_rois.shape[0]} elements to match the length of 'targeted_rois'."
+            f"'power_per_roi' has {n_targets + 2} elements but it must have"
+            f" {n_targets} elements to match the length of 'targeted_rois'."
         )
         self.assertEqual(str(context.exception), expected_error_message)
+        self.assertEqual(len(stimulus_table), 0)
 
     def test_constructor_add_interval_power_and_power_per_roi_both_defined_fail(self):
         """Test that the constructor for PatternedOptogeneticStimulusTable fails when defining
@@ -353,7 +364,8 @@ class TestPatternedOgenConstructor(TestCase):
         stop_time = 1.0
 
         targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
-        power_per_roi = np.random.uniform(50e-3, 70e-3, targets.targeted_rois.shape[0])
+        n_targets = targets.targeted_rois.shape[0]
+        power_per_roi = np.full(n_targets, 60e-3)
         power = 50e-3
 
         interval_parameter = dict(
@@ -372,6 +384,7 @@ class TestPatternedOgenConstructor(TestCase):
         # Assert that the error message matches the expected one
         expected_error_message = "Both 'power' and 'power_per_roi' have been defined. Only one of them must be defined."
         self.assertEqual(str(context.exception), expected_error_message)
+        self.assertEqual(len(stimulus_table), 0)
 
     def test_constructor_add_interval_power_and_power_per_roi_both_not_defined_fail(self):
         """Test that the constructor for PatternedOptogeneticStimulusTable fails when not defining
@@ -403,6 +416,312 @@ class TestPatternedOgenConstructor(TestCase):
             "Neither 'power' nor 'power_per_roi' have been defined. At least one of the two must be defined."
         )
         self.assertEqual(str(context.exception), expected_error_message)
+        self.assertEqual(len(stimulus_table), 0)
+
+    def test_constructor_add_intervals(self):
+        """Test that the constructor for PatternedOptogeneticStimulusTable sets values as expected,
+        using add_intervals() function."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        start_time = [0.0, 1.0, 2.0]
+        stop_time = [0.5, 1.5, 2.5]
+        power = [70.0, 60.0, 50.0]
+        targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+
+        stimulus_table.add_intervals(
+            start_time=start_time,
+            stop_time=stop_time,
+            power=power,
+            stimulus_pattern=mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile),
+            targets=targets,
+            stimulus_site=mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile),
+        )
+
+        self.assertEqual(len(stimulus_table), 3)
+        np.testing.assert_array_equal(stimulus_table.id[:], [0, 1, 2])
+        np.testing.assert_array_equal(stimulus_table.start_time[:], start_time)
+        np.testing.assert_array_equal(stimulus_table.stop_time[:], stop_time)
+        np.testing.assert_array_equal(stimulus_table.power[:], power)
+        self.assertEqual(stimulus_table.targets[:], [targets, targets, targets])
+
+    def test_constructor_add_intervals_scalar_parameters(self):
+        """Test that add_intervals() uses a scalar 'power', 'frequency' and 'pulse_width'
+        for all the stimulus onsets."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        stimulus_table.add_intervals(
+            start_time=np.array([0.0, 1.0, 2.0]),
+            stop_time=np.array([0.5, 1.5, 2.5]),
+            power=70.0,
+            frequency=20.0,
+            pulse_width=0.1,
+            stimulus_pattern=mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile),
+            targets=mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile),
+            stimulus_site=mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile),
+        )
+
+        np.testing.assert_array_equal(stimulus_table.power[:], [70.0, 70.0, 70.0])
+        np.testing.assert_array_equal(stimulus_table.frequency[:], [20.0, 20.0, 20.0])
+        np.testing.assert_array_equal(stimulus_table.pulse_width[:], [0.1, 0.1, 0.1])
+
+    def test_constructor_add_intervals_length_mismatch_fail(self):
+        """Test that the constructor for PatternedOptogeneticStimulusTable fails when the parameters
+        passed to add_intervals() do not have one element per stimulus onset."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        interval_parameter = dict(
+            start_time=[0.0, 1.0, 2.0],
+            stop_time=[0.5, 1.5, 2.5],
+            power=[70.0, 60.0],
+            stimulus_pattern=mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile),
+            targets=mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile),
+            stimulus_site=mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            stimulus_table.add_intervals(**interval_parameter)
+
+        # Assert that the error message matches the expected one
+        expected_error_message = (
+            "'power' has 2 elements but it must have 3 elements to match the length of 'start_time'."
+        )
+        self.assertEqual(str(context.exception), expected_error_message)
+        self.assertEqual(len(stimulus_table), 0)
+
+    def test_constructor_add_intervals_element_type_fail(self):
+        """Test that the constructor for PatternedOptogeneticStimulusTable fails when an element of
+        'targets', 'stimulus_pattern' or 'stimulus_site' passed to add_intervals() has the wrong type."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        stimulus_pattern = mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile)
+        stimulus_site = mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile)
+        invalid_elements = dict(
+            targets=[targets, "targets"],
+            stimulus_pattern=[stimulus_pattern, None],
+            stimulus_site=[stimulus_site, 3],
+        )
+        expected_types = dict(
+            targets="OptogeneticStimulusTarget",
+            stimulus_pattern="LabMetaData",
+            stimulus_site="PatternedOptogeneticStimulusSite",
+        )
+
+        for key, elements in invalid_elements.items():
+            interval_parameter = dict(
+                start_time=[0.0, 1.0],
+                stop_time=[0.5, 1.5],
+                power=[70.0, 60.0],
+                stimulus_pattern=stimulus_pattern,
+                targets=targets,
+                stimulus_site=stimulus_site,
+            )
+            interval_parameter[key] = elements
+
+            with self.subTest(key=key):
+                with self.assertRaises(TypeError) as context:
+                    stimulus_table.add_intervals(**interval_parameter)
+
+                # Assert that the error message matches the expected one
+                expected_error_message = (
+                    f"incorrect type for an element of '{key}' (got '{type(elements[1]).__name__}', expected"
+                    f" '{expected_types[key]}')"
+                )
+                self.assertEqual(str(context.exception), expected_error_message)
+                self.assertEqual(len(stimulus_table), 0)
+
+    def test_constructor_add_intervals_nested_values_fail(self):
+        """Test that the constructor for PatternedOptogeneticStimulusTable fails when the start times,
+        stop times or per-onset parameters passed to add_intervals() are not one-dimensional."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        stimulus_pattern = mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile)
+        stimulus_site = mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile)
+        nested_values = dict(
+            start_time=[[0.0, 1.0]],
+            stop_time=[[0.5, 1.5]],
+            power=[[70.0, 60.0]],
+        )
+
+        for key, values in nested_values.items():
+            interval_parameter = dict(
+                start_time=[0.0],
+                stop_time=[0.5],
+                power=[70.0],
+                stimulus_pattern=stimulus_pattern,
+                targets=targets,
+                stimulus_site=stimulus_site,
+            )
+            interval_parameter[key] = values
+
+            with self.subTest(key=key):
+                with self.assertRaises(ValueError):
+                    stimulus_table.add_intervals(**interval_parameter)
+                self.assertEqual(len(stimulus_table), 0)
+
+    def test_constructor_add_intervals_missing_column_fail(self):
+        """Test that the constructor for PatternedOptogeneticStimulusTable fails without adding any column
+        when add_intervals() does not provide values for a column the table already has."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+        stimulus_table.add_column(name="power", description="power")
+        stimulus_table.add_column(name="frequency", description="frequency")
+
+        interval_parameter = dict(
+            start_time=[0.0],
+            stop_time=[0.5],
+            power=[70.0],
+            pulse_width=[0.1],
+            stimulus_pattern=mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile),
+            targets=mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile),
+            stimulus_site=mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            stimulus_table.add_intervals(**interval_parameter)
+
+        # Assert that the error message matches the expected one
+        expected_error_message = "Values for the columns ['frequency'] are missing."
+        self.assertEqual(str(context.exception), expected_error_message)
+        self.assertEqual(len(stimulus_table), 0)
+        self.assertNotIn("pulse_width", stimulus_table.colnames)
+
+    def test_constructor_add_intervals_power_per_roi_fail_for_mismatch_dim(self):
+        """Test that the constructor for PatternedOptogeneticStimulusTable fails when defining
+        the elements of 'power_per_roi' with a different length with respect to 'targets'
+        using add_intervals() function."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        n_targets = targets.targeted_rois.shape[0]
+
+        interval_parameter = dict(
+            start_time=[0.0, 1.0],
+            stop_time=[0.5, 1.5],
+            power_per_roi=[np.full(n_targets, 60e-3), np.full(n_targets + 2, 60e-3)],
+            stimulus_pattern=mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile),
+            targets=targets,
+            stimulus_site=mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            stimulus_table.add_intervals(**interval_parameter)
+
+        # Assert that the error message matches the expected one
+        expected_error_message = (
+            f"'power_per_roi' has {n_targets + 2} elements but it must have"
+            f" {n_targets} elements to match the length of 'targeted_rois'."
+        )
+        self.assertEqual(str(context.exception), expected_error_message)
+        self.assertEqual(len(stimulus_table), 0)
+
+    def test_constructor_add_intervals_power_and_power_per_roi_both_defined_fail(self):
+        """Test that the constructor for PatternedOptogeneticStimulusTable fails when defining
+        both 'power_per_roi' and 'power', using add_intervals() function."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        n_targets = targets.targeted_rois.shape[0]
+
+        interval_parameter = dict(
+            start_time=[0.0, 1.0],
+            stop_time=[0.5, 1.5],
+            power=[70.0, 60.0],
+            power_per_roi=[np.full(n_targets, 60e-3), np.full(n_targets, 60e-3)],
+            stimulus_pattern=mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile),
+            targets=targets,
+            stimulus_site=mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            stimulus_table.add_intervals(**interval_parameter)
+
+        # Assert that the error message matches the expected one
+        expected_error_message = "Both 'power' and 'power_per_roi' have been defined. Only one of them must be defined."
+        self.assertEqual(str(context.exception), expected_error_message)
+        self.assertEqual(len(stimulus_table), 0)
+
+    def test_constructor_add_intervals_power_and_power_per_roi_both_not_defined_fail(self):
+        """Test that the constructor for PatternedOptogeneticStimulusTable fails when not defining
+        'power_per_roi' or 'power', using add_intervals() function."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        interval_parameter = dict(
+            start_time=[0.0, 1.0],
+            stop_time=[0.5, 1.5],
+            frequency=[20.0, 10.0],
+            stimulus_pattern=mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile),
+            targets=mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile),
+            stimulus_site=mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile),
+        )
+
+        with self.assertRaises(ValueError) as context:
+            stimulus_table.add_intervals(**interval_parameter)
+
+        # Assert that the error message matches the expected one
+        expected_error_message = (
+            "Neither 'power' nor 'power_per_roi' have been defined. At least one of the two must be defined."
+        )
+        self.assertEqual(str(context.exception), expected_error_message)
+        self.assertEqual(len(stimulus_table), 0)
+
+    def test_constructor_add_intervals_empty(self):
+        """Test that add_intervals() leaves the PatternedOptogeneticStimulusTable unchanged
+        when no stimulus onset is given."""
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+        colnames = stimulus_table.colnames
+
+        stimulus_table.add_intervals(
+            start_time=[],
+            stop_time=[],
+            power=[],
+            stimulus_pattern=[],
+            targets=[],
+            stimulus_site=[],
+        )
+
+        self.assertEqual(len(stimulus_table), 0)
+        self.assertEqual(stimulus_table.colnames, colnames)
 
 
 class TestPatternedOptogeneticStimulusTableSimpleRoundtrip(TestCase):
@@ -452,7 +771,7 @@ class TestPatternedOptogeneticStimulusTableSimpleRoundtrip(TestCase):
         with NWBHDF5IO(self.path, mode="w") as io:
             io.write(self.nwbfile)
 
-        with NWBHDF5IO(self.path, mode="r", load_namespaces=True) as io:
+        with NWBHDF5IO(self.path, mode="r", load_namespaces=False) as io:
             read_nwbfile = io.read()
             self.assertContainerEqual(stimulus_table, read_nwbfile.intervals["PatternedOptogeneticStimulusTable"])
 
@@ -467,9 +786,10 @@ class TestPatternedOptogeneticStimulusTableSimpleRoundtrip(TestCase):
         stop_time = VectorData(name="stop_time", description="stop time", data=[1.0, 1.0, 1.0])
 
         targets_s = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        n_targets = targets_s.targeted_rois.shape[0]
         targets = VectorData(name="targets", description="targets", data=[targets_s, targets_s, targets_s])
 
-        per_rois = np.ones((len(targets_s.targeted_rois[:])))
+        per_rois = np.ones(n_targets)
         power_per_roi = VectorData(
             name="power_per_roi", description="power_per_roi", data=[per_rois, per_rois, per_rois]
         )
@@ -496,7 +816,7 @@ class TestPatternedOptogeneticStimulusTableSimpleRoundtrip(TestCase):
         with NWBHDF5IO(self.path, mode="w") as io:
             io.write(self.nwbfile)
 
-        with NWBHDF5IO(self.path, mode="r", load_namespaces=True) as io:
+        with NWBHDF5IO(self.path, mode="r", load_namespaces=False) as io:
             read_nwbfile = io.read()
             self.assertContainerEqual(stimulus_table, read_nwbfile.intervals["PatternedOptogeneticStimulusTable"])
 
@@ -534,7 +854,7 @@ class TestPatternedOptogeneticStimulusTableSimpleRoundtrip(TestCase):
         with NWBHDF5IO(self.path, mode="w") as io:
             io.write(self.nwbfile)
 
-        with NWBHDF5IO(self.path, mode="r", load_namespaces=True) as io:
+        with NWBHDF5IO(self.path, mode="r", load_namespaces=False) as io:
             read_nwbfile = io.read()
             self.assertContainerEqual(stimulus_table, read_nwbfile.intervals["PatternedOptogeneticStimulusTable"])
 
@@ -553,9 +873,10 @@ class TestPatternedOptogeneticStimulusTableSimpleRoundtrip(TestCase):
         start_time = 0.0
         stop_time = 1.0
         targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
-        power_per_roi = np.random.uniform(50e-3, 70e-3, targets.targeted_rois.shape[0])
-        frequency_per_roi = np.random.uniform(20.0, 100.0, targets.targeted_rois.shape[0])
-        pulse_width_per_roi = np.random.uniform(0.1, 0.2, targets.targeted_rois.shape[0])
+        n_targets = targets.targeted_rois.shape[0]
+        power_per_roi = _RNG.uniform(50e-3, 70e-3, n_targets)
+        frequency_per_roi = _RNG.uniform(20.0, 100.0, n_targets)
+        pulse_width_per_roi = _RNG.uniform(0.1, 0.2, n_targets)
 
         stimulus_table.add_interval(
             start_time=start_time,
@@ -573,7 +894,40 @@ class TestPatternedOptogeneticStimulusTableSimpleRoundtrip(TestCase):
         with NWBHDF5IO(self.path, mode="w") as io:
             io.write(self.nwbfile)
 
-        with NWBHDF5IO(self.path, mode="r", load_namespaces=True) as io:
+        with NWBHDF5IO(self.path, mode="r", load_namespaces=False) as io:
+            read_nwbfile = io.read()
+            self.assertContainerEqual(stimulus_table, read_nwbfile.intervals["PatternedOptogeneticStimulusTable"])
+
+    def test_roundtrip_add_intervals(self):
+        """
+        Add a PatternedOptogeneticStimulusTable filled with add_intervals() to an NWBFile, write it
+        to file, read the file, and test that the PatternedOptogeneticStimulusTable
+        from the file matches the original PatternedOptogeneticStimulusTable.
+        """
+
+        stimulus_table = PatternedOptogeneticStimulusTable(
+            name="PatternedOptogeneticStimulusTable",
+            description="description",
+        )
+
+        targets = mock_OptogeneticStimulusTarget(nwbfile=self.nwbfile)
+        n_targets = targets.targeted_rois.shape[0]
+        stimulus_table.add_intervals(
+            start_time=[0.0, 1.0],
+            stop_time=[0.5, 1.5],
+            power_per_roi=[np.full(n_targets, 50e-3), np.full(n_targets, 70e-3)],
+            frequency=[20.0, 10.0],
+            stimulus_pattern=mock_OptogeneticStimulus2DPattern(nwbfile=self.nwbfile),
+            targets=targets,
+            stimulus_site=mock_PatternedOptogeneticStimulusSite(nwbfile=self.nwbfile),
+        )
+
+        self.nwbfile.add_time_intervals(stimulus_table)
+
+        with NWBHDF5IO(self.path, mode="w") as io:
+            io.write(self.nwbfile)
+
+        with NWBHDF5IO(self.path, mode="r", load_namespaces=False) as io:
             read_nwbfile = io.read()
             self.assertContainerEqual(stimulus_table, read_nwbfile.intervals["PatternedOptogeneticStimulusTable"])
 